@@ -108,6 +108,11 @@ apt-get install -y -qq python3-rich python3-yaml 2>/dev/null || {
     }
 }
 
+# Optional: jeepney lets vortexl2 talk to systemd over D-Bus (faster than systemctl)
+apt-get install -y -qq python3-jeepney 2>/dev/null || \
+    pip3 install --quiet --break-system-packages jeepney 2>/dev/null || \
+    pip3 install --quiet jeepney 2>/dev/null || true
+
 # Create launcher script
 cat > "$BIN_PATH" << 'EOF'
 #!/bin/bash
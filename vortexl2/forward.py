@@ -5,68 +5,287 @@ Handles socat-based TCP port forwarding with systemd service management.
 Each port forward gets its own service file with the correct remote IP.
 """
 
+import json
+import os
+import shlex
+import shutil
 import subprocess
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Tuple, Dict
 
+# jeepney is optional: when present we talk to systemd over D-Bus directly,
+# otherwise every operation falls back to spawning systemctl.
+try:
+    from jeepney import DBusAddress, new_method_call
+    from jeepney.io.blocking import open_dbus_connection
+    from jeepney.wrappers import unwrap_msg
+    _HAVE_JEEPNEY = True
+except ImportError:
+    _HAVE_JEEPNEY = False
 
-SYSTEMD_DIR = Path("/etc/systemd/system")
-
-# Service file template - one per port (not a systemd template)
-SERVICE_TEMPLATE = """[Unit]
-Description=VortexL2 Port Forward - {tunnel} - Port {port}
-After=network.target
-Requires=network.target
-
-[Service]
-Type=simple
-ExecStart=/usr/bin/socat TCP4-LISTEN:{port},bind={listen_ip},reuseaddr,fork TCP4:{remote_ip}:{port}
-Restart=always
-RestartSec=5
-
-[Install]
-WantedBy=multi-user.target
-"""
 
+SYSTEMD_DIR = Path("/etc/systemd/system")
 
-def run_command(cmd: str) -> Tuple[bool, str]:
-    """Execute a shell command and return (success, output)."""
+# Resolve systemctl once per process so the fallback path skips a PATH
+# search on every invocation (the D-Bus connection itself is process-wide)
+_SYSTEMCTL_BIN = shutil.which("systemctl") or "systemctl"
+
+# Unit-name sanitizing: a 256-entry translate table folds A-Z to a-z and maps
+# every byte outside [a-z0-9_-] to '-', in one C-level pass over the buffer
+_SANITIZE_TABLE = bytes(
+    (b + 0x20) if 0x41 <= b <= 0x5A else
+    b if (0x61 <= b <= 0x7A or 0x30 <= b <= 0x39 or b in (0x2D, 0x5F)) else
+    0x2D
+    for b in range(256)
+)
+_DASH_RE = re.compile(r"-+")
+
+# Old-style unit files: vortexl2-fwd-<port>.service (no tunnel name)
+_LEGACY_UNIT_RE = re.compile(r"vortexl2-fwd-(\d+)\.service$")
+
+# A port token from user input: plain digits, no sign/whitespace tricks
+_PORT_RE = re.compile(r"\d{1,5}$")
+
+# Static segments of the per-port unit file (not a systemd template). The
+# dynamic fields are spliced in between, so every file shares these buffers
+# and can be written with a single vectored os.writev call.
+_SEG_HEAD = b"[Unit]\nDescription=VortexL2 Port Forward - "
+_SEG_PORT = b" - Port "
+_SEG_EXEC = (
+    b"\nAfter=network.target\n"
+    b"Requires=network.target\n"
+    b"\n"
+    b"[Service]\n"
+    b"Type=simple\n"
+    b"ExecStart=/usr/bin/socat TCP4-LISTEN:"
+)
+_SEG_BIND = b",bind="
+_SEG_FORK = b",reuseaddr,fork TCP4:"
+_SEG_COLON = b":"
+_SEG_TAIL = (
+    b"\nRestart=always\n"
+    b"RestartSec=5\n"
+    b"\n"
+    b"[Install]\n"
+    b"WantedBy=multi-user.target\n"
+)
+
+
+def _service_segments(tunnel: bytes, port: bytes, remote_ip: bytes,
+                      listen_ip: bytes) -> List[bytes]:
+    """Buffer list for one unit file, ready for os.writev (fields pre-encoded)."""
+    return [
+        _SEG_HEAD, tunnel, _SEG_PORT, port,
+        _SEG_EXEC, port, _SEG_BIND, listen_ip,
+        _SEG_FORK, remote_ip, _SEG_COLON, port,
+        _SEG_TAIL,
+    ]
+
+
+def _render_service(tunnel: str, port: int, remote_ip: str, listen_ip: str) -> bytes:
+    """Render a complete per-port unit file as bytes."""
+    return b"".join(_service_segments(
+        str(tunnel).encode(), str(port).encode(),
+        str(remote_ip).encode(), str(listen_ip).encode(),
+    ))
+
+
+def run_command(cmd) -> Tuple[bool, str]:
+    """Execute a command (string or argv list) and return (success, output).
+
+    Runs without a shell: one fork+exec instead of two, and no /bin/sh
+    parsing. Every command here is a plain argv anyway.
+    """
     try:
         result = subprocess.run(
-            cmd,
-            shell=True,
+            shlex.split(cmd) if isinstance(cmd, str) else cmd,
             capture_output=True,
-            text=True,
             timeout=30
         )
-        output = result.stdout.strip() or result.stderr.strip()
+        # Capture raw bytes and decode only the stream we actually return,
+        # instead of having text=True decode both unconditionally
+        raw = result.stdout.strip() or result.stderr.strip()
+        output = raw.decode(errors="replace") if raw else ""
         return result.returncode == 0, output
     except Exception as e:
         return False, str(e)
 
 
+@dataclass(slots=True)
+class ForwardStatus:
+    """Status of one configured port forward."""
+    port: int
+    status: str
+    enabled: str
+    remote: str
+
+
+class _SystemdBus:
+    """Persistent connection to systemd's manager interface on the system bus.
+
+    Calling the manager methods directly skips the fork+exec of /bin/sh and
+    systemctl for every unit operation.
+    """
+
+    def __init__(self):
+        self._addr = DBusAddress(
+            "/org/freedesktop/systemd1",
+            bus_name="org.freedesktop.systemd1",
+            interface="org.freedesktop.systemd1.Manager",
+        )
+        self._conn = open_dbus_connection(bus="SYSTEM")
+        # The blocking jeepney connection is not thread-safe; serialize calls
+        # so the *_all_forwards thread pools can share it.
+        self._lock = threading.Lock()
+
+    def _call(self, method: str, signature: str = "", body: tuple = ()):
+        msg = new_method_call(self._addr, method, signature, body)
+        with self._lock:
+            return unwrap_msg(self._conn.send_and_get_reply(msg))
+
+    def start_unit(self, name: str) -> None:
+        self._call("StartUnit", "ss", (name, "replace"))
+
+    def stop_unit(self, name: str) -> None:
+        self._call("StopUnit", "ss", (name, "replace"))
+
+    def restart_unit(self, name: str) -> None:
+        self._call("RestartUnit", "ss", (name, "replace"))
+
+    def enable_unit_files(self, names: List[str]) -> None:
+        # (runtime=False, force=True) matches systemctl enable --force semantics
+        self._call("EnableUnitFiles", "asbb", (names, False, True))
+
+    def disable_unit_files(self, names: List[str]) -> None:
+        self._call("DisableUnitFiles", "asb", (names, False))
+
+    def reload(self) -> None:
+        self._call("Reload")
+
+    def close(self) -> None:
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+
+
+_bus = None
+_bus_unavailable = not _HAVE_JEEPNEY
+
+
+def _get_bus():
+    """Return the shared _SystemdBus, or None when D-Bus is not reachable."""
+    global _bus, _bus_unavailable
+    if _bus is None and not _bus_unavailable:
+        try:
+            _bus = _SystemdBus()
+        except Exception:
+            _bus_unavailable = True
+    return _bus
+
+
+def _drop_bus() -> None:
+    """Forget a broken bus connection so callers fall back to systemctl."""
+    global _bus, _bus_unavailable
+    if _bus is not None:
+        _bus.close()
+    _bus = None
+    _bus_unavailable = True
+
+
+def _systemctl(action: str, *units: str) -> Tuple[bool, str]:
+    """Perform a systemd operation, preferring the D-Bus fast path.
+
+    `action` is the systemctl verb ("start", "stop", "restart", "enable",
+    "disable", "enable --now", "disable --now", "daemon-reload"); `units` are
+    unit names. Falls back to the systemctl binary when D-Bus is unavailable.
+    """
+    bus = _get_bus()
+    if bus is not None:
+        try:
+            if action == "daemon-reload":
+                bus.reload()
+            elif action == "start":
+                for unit in units:
+                    bus.start_unit(unit)
+            elif action == "stop":
+                for unit in units:
+                    bus.stop_unit(unit)
+            elif action == "restart":
+                for unit in units:
+                    bus.restart_unit(unit)
+            elif action == "enable":
+                bus.enable_unit_files(list(units))
+            elif action == "disable":
+                bus.disable_unit_files(list(units))
+            elif action == "enable --now":
+                bus.enable_unit_files(list(units))
+                for unit in units:
+                    bus.start_unit(unit)
+            elif action == "disable --now":
+                for unit in units:
+                    bus.stop_unit(unit)
+                bus.disable_unit_files(list(units))
+            else:
+                raise ValueError(f"Unsupported systemd action: {action}")
+            return True, ""
+        except (ConnectionError, OSError):
+            # Connection died; fall through to the systemctl binary
+            _drop_bus()
+        except ValueError:
+            pass
+        except Exception as e:
+            return False, str(e)
+
+    cmd = f"{_SYSTEMCTL_BIN} {action}"
+    if action in ("start", "restart", "enable --now"):
+        # The socat forwards are Type=simple and never signal readiness, so
+        # waiting for job completion buys nothing; enqueue and return, the
+        # same semantics the D-Bus StartUnit path has.
+        cmd += " --no-block"
+    if units:
+        cmd += " " + " ".join(units)
+    return run_command(cmd)
+
+
 class ForwardManager:
     """Manages socat port forwarding services."""
 
     def __init__(self, config):
         self.config = config
+        # Sanitizing the tunnel name runs regexes; it is needed for every
+        # unit-name lookup, so cache it keyed on the raw config name.
+        self._tname_src = getattr(config, "name", "tunnel")
+        self._tname = self._sanitize_unit_part(self._tname_src)
+        # Ports with old-style unit files; filled by the first legacy scan
+        self._legacy_ports = None
 
     def _sanitize_unit_part(self, s: str) -> str:
         """Make a safe systemd unit name fragment."""
-        s = (s or "").strip().lower()
-        s = "".join(c if (c.isalnum() or c in "-_") else "-" for c in s)
-        s = re.sub(r"-+", "-", s).strip("-")
+        s = (s or "").strip().encode("ascii", "replace")
+        s = s.translate(_SANITIZE_TABLE).decode("ascii")
+        s = _DASH_RE.sub("-", s).strip("-")
         return s or "tunnel"
 
+    def _tunnel_unit_part(self) -> str:
+        """Cached sanitized tunnel name; recomputed if config.name changed."""
+        name = getattr(self.config, "name", "tunnel")
+        if name != self._tname_src:
+            self._tname_src = name
+            self._tname = self._sanitize_unit_part(name)
+        return self._tname
+
     def _legacy_service_name(self, port: int) -> str:
         """Old unit naming (pre multi-tunnel-safe)."""
         return f"vortexl2-fwd-{port}.service"
 
     def _get_service_name(self, port: int) -> str:
         """New unit naming includes tunnel name to avoid collisions."""
-        tname = self._sanitize_unit_part(getattr(self.config, "name", "tunnel"))
-        return f"vortexl2-fwd-{tname}-{port}.service"
+        return f"vortexl2-fwd-{self._tunnel_unit_part()}-{port}.service"
 
     def _get_service_path(self, port: int) -> Path:
         return SYSTEMD_DIR / self._get_service_name(port)
@@ -74,50 +293,108 @@ class ForwardManager:
     def _legacy_service_path(self, port: int) -> Path:
         return SYSTEMD_DIR / self._legacy_service_name(port)
 
-    def _migrate_legacy_unit(self, port: int) -> None:
-        """If an old-style unit exists for this port, stop/disable it and remove the file."""
+    def _scan_legacy_ports(self) -> set:
+        """Ports that still have old-style unit files, from one cached dir scan."""
+        if self._legacy_ports is None:
+            ports = set()
+            for path in SYSTEMD_DIR.glob("vortexl2-fwd-*.service"):
+                match = _LEGACY_UNIT_RE.match(path.name)
+                if match:
+                    ports.add(int(match.group(1)))
+            self._legacy_ports = ports
+        return self._legacy_ports
+
+    def _migrate_legacy_unit(self, port: int, reload: bool = True) -> bool:
+        """If an old-style unit exists for this port, stop/disable it and remove the file.
+
+        Batch callers pass reload=False and issue one daemon-reload themselves;
+        returns True when a legacy unit was removed.
+        """
+        # Cheap negative check: one dir scan is cached, so the common
+        # no-legacy-left case skips the stat per port entirely.
+        if port not in self._scan_legacy_ports():
+            return False
+
         legacy_name = self._legacy_service_name(port)
         legacy_path = self._legacy_service_path(port)
-        if legacy_path.exists():
-            run_command(f"systemctl stop {legacy_name}")
-            run_command(f"systemctl disable {legacy_name}")
-            try:
-                legacy_path.unlink()
-            except Exception:
-                pass
-            run_command("systemctl daemon-reload")
-
-    def create_forward(self, port: int) -> Tuple[bool, str]:
-        """Create and start a port forward service."""
+        if not legacy_path.exists():
+            self._legacy_ports.discard(port)
+            return False
+        _systemctl("stop", legacy_name)
+        _systemctl("disable", legacy_name)
+        try:
+            legacy_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        if reload:
+            _systemctl("daemon-reload")
+        self._legacy_ports.discard(port)
+        return True
+
+    def _write_service_file(self, port: int) -> Tuple[bool, str]:
+        """Render and write the unit file for a port (no systemctl calls)."""
+        return self._write_service_files([port])[port]
+
+    def _write_service_files(self, ports: List[int]) -> Dict[int, Tuple[bool, str]]:
+        """Render and write unit files for many ports (no systemctl calls).
+
+        All contents are rendered first, then written in one tight loop of
+        low-level os.open/os.write calls; each file still lands via a tmp
+        file + rename so systemd never sees a partial unit.
+        """
         remote_ip = getattr(self.config, "remote_forward_ip", None)
         if not remote_ip:
-            return False, "Remote forward IP not configured"
+            return {port: (False, "Remote forward IP not configured") for port in ports}
 
-        listen_ip = getattr(self.config, "listen_ip", "0.0.0.0")
+        # The tunnel/bind/remote fields are identical for every port; encode
+        # them once and share the buffers across all writev calls.
+        tunnel_b = str(getattr(self.config, "name", "tunnel")).encode()
+        listen_b = str(getattr(self.config, "listen_ip", "0.0.0.0")).encode()
+        remote_b = str(remote_ip).encode()
 
+        rendered = [
+            (port, _service_segments(tunnel_b, str(port).encode(), remote_b, listen_b))
+            for port in ports
+        ]
+
+        outcomes = {}
+        for port, segments in rendered:
+            service_path = self._get_service_path(port)
+            tmp_path = str(service_path) + ".tmp"
+            try:
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    if os.writev(fd, segments) != sum(len(s) for s in segments):
+                        raise OSError("short write")
+                finally:
+                    os.close(fd)
+                os.replace(tmp_path, service_path)
+                outcomes[port] = (True, f"Service file written for port {port}")
+            except Exception as e:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                outcomes[port] = (False, f"Failed to create service file: {e}")
+
+        return outcomes
+
+    def create_forward(self, port: int) -> Tuple[bool, str]:
+        """Create and start a port forward service."""
         # Clean up legacy unit if present
         self._migrate_legacy_unit(port)
 
-        service_path = self._get_service_path(port)
-        service_name = self._get_service_name(port)
-        tunnel_name = getattr(self.config, "name", "tunnel")
-
-        service_content = SERVICE_TEMPLATE.format(
-            tunnel=tunnel_name,
-            port=port,
-            remote_ip=remote_ip,
-            listen_ip=listen_ip
-        )
+        success, msg = self._write_service_file(port)
+        if not success:
+            return False, msg
 
-        try:
-            with open(service_path, "w") as f:
-                f.write(service_content)
-        except Exception as e:
-            return False, f"Failed to create service file: {e}"
+        service_name = self._get_service_name(port)
+        remote_ip = getattr(self.config, "remote_forward_ip", None)
+        listen_ip = getattr(self.config, "listen_ip", "0.0.0.0")
 
-        run_command("systemctl daemon-reload")
+        _systemctl("daemon-reload")
 
-        success, output = run_command(f"systemctl enable --now {service_name}")
+        success, output = _systemctl("enable --now", service_name)
         if not success:
             return False, f"Failed to start forward for port {port}: {output}"
 
@@ -131,129 +408,312 @@ class ForwardManager:
         service_name = self._get_service_name(port)
         legacy_name = self._legacy_service_name(port)
 
-        run_command(f"systemctl stop {service_name}")
-        run_command(f"systemctl disable {service_name}")
-        run_command(f"systemctl stop {legacy_name}")
-        run_command(f"systemctl disable {legacy_name}")
+        _systemctl("stop", service_name)
+        _systemctl("disable", service_name)
+        _systemctl("stop", legacy_name)
+        _systemctl("disable", legacy_name)
 
-        # Remove service files (new + legacy if any)
+        # Remove service files (new + legacy if any); missing_ok avoids the
+        # exists/unlink stat race and one stat per file
         for path in [self._get_service_path(port), self._legacy_service_path(port)]:
-            if path.exists():
-                try:
-                    path.unlink()
-                except Exception:
-                    pass
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
 
-        run_command("systemctl daemon-reload")
+        _systemctl("daemon-reload")
 
         self.config.remove_port(port)
         return True, f"Port forward for {port} removed"
 
-    def add_multiple_forwards(self, ports_str: str) -> Tuple[bool, str]:
-        """Add multiple port forwards from comma-separated string."""
-        results = []
-        ports = [p.strip() for p in ports_str.split(",") if p.strip()]
+    def _parse_ports(self, ports_str: str) -> Tuple[List[int], List[str]]:
+        """Validate a comma-separated port list in one pass.
 
-        for port_str in ports:
-            try:
-                port = int(port_str)
-                success, msg = self.create_forward(port)
+        Returns (valid ports, error messages for the rejected tokens).
+        """
+        ports = []
+        errors = []
+        for token in ports_str.split(","):
+            token = token.strip()
+            if not token:
+                continue
+            if _PORT_RE.match(token) and 0 < int(token) <= 65535:
+                ports.append(int(token))
+            else:
+                errors.append(f"Port '{token}': Invalid port number")
+        return ports, errors
+
+    def add_multiple_forwards(self, ports_str: str) -> Tuple[bool, str]:
+        """Add multiple port forwards from comma-separated string.
+
+        Unit files are written first, then systemd is poked once: a single
+        daemon-reload followed by a single enable --now for all units, instead
+        of a full stop/reload/enable round-trip per port.
+        """
+        ports, results = self._parse_ports(ports_str)
+
+        written = []
+        migrated = False
+        for port in ports:
+            migrated = self._migrate_legacy_unit(port, reload=False) or migrated
+
+        outcomes = self._write_service_files(ports) if ports else {}
+        for port in ports:
+            success, msg = outcomes[port]
+            if success:
+                written.append(port)
+            else:
                 results.append(f"Port {port}: {msg}")
-            except ValueError:
-                results.append(f"Port '{port_str}': Invalid port number")
+
+        if written or migrated:
+            _systemctl("daemon-reload")
+
+        if written:
+            unit_names = [self._get_service_name(port) for port in written]
+            success, output = _systemctl("enable --now", *unit_names)
+
+            remote_ip = getattr(self.config, "remote_forward_ip", "-")
+            listen_ip = getattr(self.config, "listen_ip", "0.0.0.0")
+            for port in written:
+                if success:
+                    self.config.add_port(port)
+                    results.append(
+                        f"Port {port}: Port forward for {port} created "
+                        f"(listen {listen_ip} -> {remote_ip}:{port})"
+                    )
+                else:
+                    results.append(f"Port {port}: Failed to start forward - {output}")
 
         return True, "\n".join(results)
 
     def remove_multiple_forwards(self, ports_str: str) -> Tuple[bool, str]:
-        """Remove multiple port forwards from comma-separated string."""
-        results = []
-        ports = [p.strip() for p in ports_str.split(",") if p.strip()]
-
-        for port_str in ports:
-            try:
-                port = int(port_str)
-                success, msg = self.remove_forward(port)
-                results.append(f"Port {port}: {msg}")
-            except ValueError:
-                results.append(f"Port '{port_str}': Invalid port number")
+        """Remove multiple port forwards from comma-separated string.
+
+        All units (new + legacy names) are stopped/disabled with one systemctl
+        invocation, then files removed and a single daemon-reload issued.
+        """
+        ports, results = self._parse_ports(ports_str)
+
+        if ports:
+            unit_names = []
+            for port in ports:
+                unit_names.append(self._get_service_name(port))
+                unit_names.append(self._legacy_service_name(port))
+            _systemctl("disable --now", *unit_names)
+
+            for port in ports:
+                for path in [self._get_service_path(port), self._legacy_service_path(port)]:
+                    try:
+                        path.unlink(missing_ok=True)
+                    except OSError:
+                        pass
+                self.config.remove_port(port)
+                results.append(f"Port {port}: Port forward for {port} removed")
+
+            _systemctl("daemon-reload")
 
         return True, "\n".join(results)
 
-    def list_forwards(self) -> List[Dict]:
-        """List all configured port forwards with their status."""
+    def _scan_active_states(self, units: List[str]):
+        """Fetch active-state for many units in one systemctl call.
+
+        Returns {unit: active-state} or None if the JSON scan isn't supported.
+        """
+        success, output = run_command(
+            f"{_SYSTEMCTL_BIN} list-units --all --no-pager --output=json " + " ".join(units)
+        )
+        if not success:
+            return None
+        try:
+            rows = json.loads(output)
+            return {row["unit"]: row.get("active", "inactive") for row in rows}
+        except (ValueError, TypeError, KeyError):
+            return None
+
+    def _scan_enabled_states(self, units: List[str]):
+        """Fetch enablement state for many units in one systemctl call.
+
+        Returns {unit: state} or None if the JSON scan isn't supported.
+        """
+        success, output = run_command(
+            f"{_SYSTEMCTL_BIN} list-unit-files --no-pager --output=json " + " ".join(units)
+        )
+        if not success:
+            return None
+        try:
+            rows = json.loads(output)
+            return {row["unit_file"]: row.get("state", "disabled") for row in rows}
+        except (ValueError, TypeError, KeyError):
+            return None
+
+    def list_forwards(self) -> List["ForwardStatus"]:
+        """List all configured port forwards with their status.
+
+        Unit states are gathered with two batched systemctl scans (one
+        list-units, one list-unit-files) rather than two queries per port.
+        """
+        ports = list(getattr(self.config, "forwarded_ports", []))
+        if not ports:
+            return []
+
+        new_units = {port: self._get_service_name(port) for port in ports}
+        legacy_units = {port: self._legacy_service_name(port) for port in ports}
+        units = []
+        for port in ports:
+            units.append(new_units[port])
+            units.append(legacy_units[port])
+
+        active_map = self._scan_active_states(units)
+        enabled_map = self._scan_enabled_states(units) if active_map is not None else None
+        if active_map is None or enabled_map is None:
+            return self._list_forwards_slow(ports)
+
+        remote_ip = getattr(self.config, "remote_forward_ip", "-")
+        forwards = []
+        for port in ports:
+            new_unit = new_units[port]
+            legacy_unit = legacy_units[port]
+
+            # Prefer new service name; fall back to legacy
+            if active_map.get(new_unit) == "active":
+                status, active_unit = "active", new_unit
+            elif active_map.get(legacy_unit) == "active":
+                status, active_unit = "active", legacy_unit
+            else:
+                status, active_unit = active_map.get(new_unit, "inactive"), new_unit
+
+            forwards.append(ForwardStatus(
+                port=port,
+                status=status,
+                enabled=enabled_map.get(active_unit, "disabled"),
+                remote=f"{remote_ip}:{port}",
+            ))
+
+        return forwards
+
+    def _list_forwards_slow(self, ports: List[int]) -> List["ForwardStatus"]:
+        """Per-port fallback for systemctl versions without --output=json."""
         forwards = []
+        remote_ip = getattr(self.config, "remote_forward_ip", "-")
 
-        for port in getattr(self.config, "forwarded_ports", []):
+        for port in ports:
             new_unit = self._get_service_name(port)
             legacy_unit = self._legacy_service_name(port)
 
             # Prefer new service name; fall back to legacy
-            success, output = run_command(f"systemctl is-active {new_unit}")
+            success, output = run_command(f"{_SYSTEMCTL_BIN} is-active {new_unit}")
             if success:
                 status = output
                 active_unit = new_unit
             else:
-                success2, output2 = run_command(f"systemctl is-active {legacy_unit}")
+                success2, output2 = run_command(f"{_SYSTEMCTL_BIN} is-active {legacy_unit}")
                 status = output2 if success2 else "inactive"
                 active_unit = legacy_unit if success2 else new_unit
 
-            success, output = run_command(f"systemctl is-enabled {active_unit}")
+            success, output = run_command(f"{_SYSTEMCTL_BIN} is-enabled {active_unit}")
             enabled = output if success else "disabled"
 
-            remote_ip = getattr(self.config, "remote_forward_ip", "-")
-            forwards.append({
-                "port": port,
-                "status": status,
-                "enabled": enabled,
-                "remote": f"{remote_ip}:{port}"
-            })
+            forwards.append(ForwardStatus(
+                port=port,
+                status=status,
+                enabled=enabled,
+                remote=f"{remote_ip}:{port}",
+            ))
 
         return forwards
 
-    def start_all_forwards(self) -> Tuple[bool, str]:
-        """Start all configured port forwards."""
-        results = []
+    def _prepare_unit_files(self, ports: List[int]) -> Tuple[List[int], Dict[int, str], set, bool]:
+        """Migrate legacy units and (re)write missing unit files for `ports`.
+
+        Runs on the calling thread so config access stays single-threaded.
+        Returns (startable ports, per-port error messages, recreated ports,
+        whether any file was written).
+        """
+        startable = []
+        errors: Dict[int, str] = {}
+        recreated = set()
+        wrote = False
 
-        for port in getattr(self.config, "forwarded_ports", []):
+        missing = []
+        for port in ports:
             # Ensure we are on the new unit naming scheme
-            self._migrate_legacy_unit(port)
+            if self._migrate_legacy_unit(port, reload=False):
+                wrote = True
 
-            service_name = self._get_service_name(port)
-            service_path = self._get_service_path(port)
+            if self._get_service_path(port).exists():
+                startable.append(port)
+            else:
+                missing.append(port)
 
-            if not service_path.exists():
-                success, msg = self.create_forward(port)
+        if missing:
+            outcomes = self._write_service_files(missing)
+            for port in missing:
+                success, msg = outcomes[port]
                 if success:
-                    results.append(f"Port {port}: recreated and started")
+                    recreated.add(port)
+                    wrote = True
+                    startable.append(port)
                 else:
-                    results.append(f"Port {port}: failed to recreate - {msg}")
-                continue
+                    errors[port] = f"failed to recreate - {msg}"
 
-            success, output = run_command(f"systemctl start {service_name}")
-            if success:
+        return startable, errors, recreated, wrote
+
+    def start_all_forwards(self) -> Tuple[bool, str]:
+        """Start all configured port forwards (units started in parallel)."""
+        ports = list(getattr(self.config, "forwarded_ports", []))
+        if not ports:
+            return True, "No port forwards configured"
+
+        startable, errors, recreated, wrote = self._prepare_unit_files(ports)
+        if wrote:
+            _systemctl("daemon-reload")
+
+        def _start_one(port: int) -> Tuple[bool, str]:
+            return _systemctl("enable --now" if port in recreated else "start",
+                              self._get_service_name(port))
+
+        outcomes = {}
+        if startable:
+            with ThreadPoolExecutor(max_workers=min(32, len(startable))) as pool:
+                outcomes = dict(zip(startable, pool.map(_start_one, startable)))
+
+        results = []
+        for port in ports:
+            if port in errors:
+                results.append(f"Port {port}: {errors[port]}")
+                continue
+            success, output = outcomes[port]
+            if success and port in recreated:
+                results.append(f"Port {port}: recreated and started")
+            elif success:
                 results.append(f"Port {port}: started")
             else:
                 results.append(f"Port {port}: failed to start - {output}")
 
-        if not results:
-            return True, "No port forwards configured"
-
         return True, "\n".join(results)
 
     def stop_all_forwards(self) -> Tuple[bool, str]:
         """Stop all configured port forwards (new + any legacy units)."""
-        results = []
-
-        for port in getattr(self.config, "forwarded_ports", []):
-            new_unit = self._get_service_name(port)
-            legacy_unit = self._legacy_service_name(port)
+        ports = list(getattr(self.config, "forwarded_ports", []))
+        if not ports:
+            return True, "No port forwards configured"
 
-            success, output = run_command(f"systemctl stop {new_unit}")
-            if success:
-                results.append(f"Port {port}: stopped ({new_unit})")
+        new_units = {port: self._get_service_name(port) for port in ports}
+        legacy_units = {port: self._legacy_service_name(port) for port in ports}
 
+        def _stop_one(port: int) -> Tuple[bool, str]:
+            success, output = _systemctl("stop", new_units[port])
             # Stop legacy too if it exists
-            run_command(f"systemctl stop {legacy_unit}")
+            _systemctl("stop", legacy_units[port])
+            return success, output
+
+        with ThreadPoolExecutor(max_workers=min(32, len(ports))) as pool:
+            outcomes = list(pool.map(_stop_one, ports))
+
+        results = []
+        for port, (success, output) in zip(ports, outcomes):
+            if success:
+                results.append(f"Port {port}: stopped ({new_units[port]})")
 
         if not results:
             return True, "No port forwards configured"
@@ -261,57 +721,76 @@ class ForwardManager:
         return True, "\n".join(results)
 
     def restart_all_forwards(self) -> Tuple[bool, str]:
-        """Restart all configured port forwards."""
-        results = []
-
-        for port in getattr(self.config, "forwarded_ports", []):
-            # Clean up any old-style units for this port
-            self._migrate_legacy_unit(port)
-
-            service_name = self._get_service_name(port)
-            service_path = self._get_service_path(port)
+        """Restart all configured port forwards (units restarted in parallel)."""
+        ports = list(getattr(self.config, "forwarded_ports", []))
+        if not ports:
+            return True, "No port forwards configured"
 
-            if not service_path.exists():
-                success, msg = self.create_forward(port)
-                if success:
-                    results.append(f"Port {port}: recreated and started")
-                else:
-                    results.append(f"Port {port}: failed to recreate - {msg}")
-                continue
+        if not getattr(self.config, "remote_forward_ip", None):
+            return True, "\n".join(
+                f"Port {port}: remote_forward_ip not set" for port in ports
+            )
 
-            remote_ip = getattr(self.config, "remote_forward_ip", None)
-            if not remote_ip:
-                results.append(f"Port {port}: remote_forward_ip not set")
-                continue
+        results_by_port: Dict[int, str] = {}
+        restartable = []
+        recreated = set()
+        wrote = False
 
-            listen_ip = getattr(self.config, "listen_ip", "0.0.0.0")
-            tunnel_name = getattr(self.config, "name", "tunnel")
+        tunnel_name = getattr(self.config, "name", "tunnel")
+        remote_ip = getattr(self.config, "remote_forward_ip", None)
+        listen_ip = getattr(self.config, "listen_ip", "0.0.0.0")
 
-            service_content = SERVICE_TEMPLATE.format(
-                tunnel=tunnel_name,
-                port=port,
-                remote_ip=remote_ip,
-                listen_ip=listen_ip
-            )
+        to_write = []
+        for port in ports:
+            # Clean up any old-style units for this port
+            if self._migrate_legacy_unit(port, reload=False):
+                wrote = True
 
+            # Only rewrite units whose rendered content actually changed, so
+            # an unchanged config skips the writes and the daemon-reload
             try:
-                with open(service_path, "w") as f:
-                    f.write(service_content)
-            except Exception as e:
-                results.append(f"Port {port}: failed to write service file - {e}")
-                continue
+                current = self._get_service_path(port).read_bytes()
+            except OSError:
+                current = None
 
-            run_command("systemctl daemon-reload")
-            success, output = run_command(f"systemctl restart {service_name}")
-            if success:
-                results.append(f"Port {port}: restarted")
+            if current == _render_service(tunnel_name, port, remote_ip, listen_ip):
+                restartable.append(port)
             else:
-                results.append(f"Port {port}: failed - {output}")
-
-        if not results:
-            return True, "No port forwards configured"
-
-        return True, "\n".join(results)
+                if current is None:
+                    recreated.add(port)
+                to_write.append(port)
+
+        if to_write:
+            outcomes = self._write_service_files(to_write)
+            for port in to_write:
+                success, msg = outcomes[port]
+                if not success:
+                    results_by_port[port] = f"failed to write service file - {msg}"
+                    recreated.discard(port)
+                    continue
+                wrote = True
+                restartable.append(port)
+
+        if wrote:
+            _systemctl("daemon-reload")
+
+        def _restart_one(port: int) -> Tuple[bool, str]:
+            return _systemctl("enable --now" if port in recreated else "restart",
+                              self._get_service_name(port))
+
+        if restartable:
+            with ThreadPoolExecutor(max_workers=min(32, len(restartable))) as pool:
+                for port, (success, output) in zip(
+                    restartable, pool.map(_restart_one, restartable)
+                ):
+                    if success and port in recreated:
+                        results_by_port[port] = "recreated and started"
+                    elif success:
+                        results_by_port[port] = "restarted"
+                    else:
+                        results_by_port[port] = f"failed - {output}"
+
+        return True, "\n".join(f"Port {port}: {results_by_port[port]}" for port in ports)
 
     def install_template(self) -> Tuple[bool, str]:
         """Backward compatible no-op (older versions used a systemd template unit)."""
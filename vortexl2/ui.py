@@ -490,14 +490,14 @@ def show_forwards_list(forwards: list):
     table.add_column("Enabled", style="white")
     
     for fwd in forwards:
-        status_style = "green" if fwd["status"] == "active" else "red"
-        enabled_style = "green" if fwd["enabled"] == "enabled" else "yellow"
-        
+        status_style = "green" if fwd.status == "active" else "red"
+        enabled_style = "green" if fwd.enabled == "enabled" else "yellow"
+
         table.add_row(
-            str(fwd["port"]),
-            fwd["remote"],
-            f"[{status_style}]{fwd['status']}[/]",
-            f"[{enabled_style}]{fwd['enabled']}[/]"
+            str(fwd.port),
+            fwd.remote,
+            f"[{status_style}]{fwd.status}[/]",
+            f"[{enabled_style}]{fwd.enabled}[/]"
         )
     
     console.print(table)